@@ -3,11 +3,16 @@
 import time
 import asyncio
 import logging
-import uuid
-from typing import List, Dict, Optional
+import secrets
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from collections import deque
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
+from itertools import chain, islice
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+import httpx
+import orjson
+from playwright.async_api import BrowserContext, Error as PlaywrightError
 
 from app.models import (
     ExtractionRequest,
@@ -19,7 +24,9 @@ from app.models import (
     BatchProgress,
     LogEntry,
 )
+from app.config import settings
 from app.scraper import PlaywrightScraper
+from app.scraper.aimd import AIMDLimiter
 from app.scraper.proxy_manager import ProxyManager
 from app import __version__
 
@@ -28,6 +35,91 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Log marker per result status
+_STATUS_EMOJI = {"success": "✓", "no_data": "⚠", "error": "✗"}
+
+
+# Failures expected while scraping (timeouts, network and proxy errors)
+_SCRAPE_ERRORS = (asyncio.TimeoutError, PlaywrightError, httpx.HTTPError)
+
+
+def _format_error(url: str, e: Exception) -> str:
+    """
+    Build the error message stored on a failed result.
+
+    Expected scraping failures only keep their one-line message; anything else
+    is also logged with its traceback at debug level.
+    """
+    if not isinstance(e, _SCRAPE_ERRORS):
+        logger.debug("Unexpected error while scraping %s", url, exc_info=e)
+    return f"{type(e).__name__}: {e}"
+
+
+# Identifiers of a failed extraction
+_EMPTY_IDS: Dict[str, Optional[str]] = {'siret': None, 'siren': None, 'tva': None}
+
+# Error stored for URLs a stopped batch never processed
+_BATCH_STOPPED = "Batch stopped before this URL was processed"
+
+
+def _mk_result(
+    url: str,
+    ids: Dict[str, Optional[str]],
+    processing_time: float,
+    worker_id: Optional[int] = None,
+    proxy_used: Optional[str] = None,
+    error: Optional[str] = None
+) -> ExtractionResult:
+    """
+    Build an ExtractionResult without pydantic validation.
+
+    All fields are produced by our own code, so validation is skipped. The
+    status is derived here: error if an error is given, otherwise success
+    when at least one identifier was found and no_data when none was.
+
+    Args:
+        url: Processed URL
+        ids: Identifiers returned by the scraper (or _EMPTY_IDS)
+        processing_time: Processing time in seconds
+        worker_id: Worker that processed the URL (batch only)
+        proxy_used: Truncated proxy used for the URL (batch only)
+        error: Error message if scraping failed
+
+    Returns:
+        ExtractionResult instance
+    """
+    get = ids.get
+    siret, siren, tva = get('siret'), get('siren'), get('tva')
+
+    if error is not None:
+        success, status = False, "error"
+    elif siret is not None or siren is not None or tva is not None:
+        success, status = True, "success"
+    else:
+        success, status, error = False, "no_data", "No valid identifiers found"
+
+    return ExtractionResult.model_construct(
+        url=url,
+        siret=siret,
+        siren=siren,
+        tva=tva,
+        success=success,
+        status=status,
+        error=error,
+        processing_time=processing_time,
+        worker_id=worker_id,
+        proxy_used=proxy_used
+    )
+
+
+# Seconds of silence after which a progress stream sends a keepalive comment
+_SSE_KEEPALIVE = 15
+
+
+def _elapsed_seconds(start: float) -> float:
+    """Seconds since a perf_counter() start, truncated to whole milliseconds"""
+    return int((time.perf_counter() - start) * 1000) / 1000
+
 
 @dataclass
 class BatchState:
@@ -36,36 +128,114 @@ class BatchState:
     total_urls: int
     completed: int = 0
     success: int = 0
-    failed: int = 0
     in_progress: bool = True
-    start_time: float = field(default_factory=time.time)
-    results: List[ExtractionResult] = field(default_factory=list)
+    current_concurrency: Optional[int] = None
+    start_time: float = field(default_factory=time.time)  # Unix timestamp shown to clients
+    start_monotonic: float = field(default_factory=time.monotonic)  # For durations (immune to clock changes)
+    results: List[Optional[ExtractionResult]] = field(default_factory=list)
+    # Fixed-size ring of the latest log entries (oldest dropped in C, no per-append copy)
     recent_logs: deque = field(default_factory=lambda: deque(maxlen=50))
+    logs_total: int = 0  # Entries ever logged, so streams can tell which logs are new
+    # One event per progress stream, set whenever the state changes
+    subscribers: Set[asyncio.Event] = field(default_factory=set)
+
+    def __post_init__(self):
+        # Pre-size results so workers can write by index (keeps input order)
+        if not self.results:
+            self.results = [None] * self.total_urls
+
+    def log(self, url: str, status: str, message: str, worker_id: Optional[int] = None) -> None:
+        """
+        Append an entry to the recent logs shown by the progress endpoint.
+
+        Entries are built from our own values, so pydantic validation is skipped.
+
+        Args:
+            url: URL the entry is about
+            status: Status: processing, success, no_data, error
+            message: Log message
+            worker_id: Worker that produced the entry
+        """
+        self.recent_logs.append(LogEntry.model_construct(
+            timestamp=time.time(),
+            url=url,
+            status=status,
+            message=message,
+            worker_id=worker_id
+        ))
+        self.logs_total += 1
+        self.notify()
+
+    def record(self, index: int, result: ExtractionResult) -> None:
+        """
+        Store a finished URL's result and update the progress counters.
+
+        All writes for one URL happen here, with no await in between, so the
+        progress endpoint never sees a result without its counters.
+
+        Args:
+            index: Position of the URL in the batch
+            result: Result for that URL
+        """
+        self.results[index] = result
+        self.completed += 1
+        if result.success:
+            self.success += 1
+        self.notify()
+
+    def notify(self) -> None:
+        """Wake up progress streams"""
+        for changed in self.subscribers:
+            changed.set()
+
+    @property
+    def failed(self) -> int:
+        """Completed URLs without identifiers (no data or error)"""
+        return self.completed - self.success
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerProxy:
+    """Proxy assigned to a batch worker, with its display forms precomputed"""
+    url: Optional[str] = None
+    display: str = "No proxy"  # Shown in log messages
+    stored: Optional[str] = None  # Stored on results (truncated)
+
+    @classmethod
+    def for_url(cls, url: Optional[str]) -> "WorkerProxy":
+        """Build the worker proxy for a proxy URL (None = direct connection)"""
+        if not url:
+            return cls()
+        return cls(url=url, display=f"Proxy: {url[:20]}...", stored=url[:50])
 
 
 # In-memory storage for batch progress and results
+# Each batch holds at most 100 results (BatchExtractionRequest.urls max_length),
+# so results stay in memory; finished batches are dropped after settings.batch_ttl seconds
 # In production, use Redis or similar
 batch_store: Dict[str, BatchState] = {}
 
 
-@router.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check_internal():
+def get_scraper(request: Request) -> PlaywrightScraper:
     """
-    Internal health check endpoint for Docker healthcheck.
+    Dependency returning the app-wide scraper started at application startup.
 
-    Returns service status and version information.
+    Falls back to creating it lazily (browser launched on first use) when the
+    startup event did not run, e.g. in tests.
     """
-    return HealthResponse(
-        status="healthy",
-        version=__version__
-    )
+    scraper = getattr(request.app.state, "scraper", None)
+    if scraper is None:
+        scraper = request.app.state.scraper = PlaywrightScraper(pool_size=settings.browser_pool_size)
+    return scraper
 
 
+@router.get("/health", response_model=HealthResponse, tags=["Health"])
 @router.get("/api/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
     """
-    External health check endpoint accessible via /api/health.
+    Health check endpoint.
 
+    Served on /health (Docker healthcheck) and /api/health (external access).
     Returns service status and version information.
     """
     return HealthResponse(
@@ -75,16 +245,18 @@ async def health_check():
 
 
 @router.post("/api/extract", response_model=ExtractionResult, tags=["Extraction"])
-async def extract_single_url(request: ExtractionRequest):
+async def extract_single_url(request: ExtractionRequest, scraper: PlaywrightScraper = Depends(get_scraper)):
     """
     Extract SIRET, SIREN, and TVA numbers from a single URL.
 
     This endpoint scrapes the provided URL and searches for French company
     identifiers using Playwright. It validates all numbers using the Luhn
-    algorithm and other checks.
+    algorithm and other checks. The browser is shared across requests, so
+    only a fresh context is created per call.
 
     Args:
         request: ExtractionRequest with URL to process
+        scraper: Shared app-wide PlaywrightScraper
 
     Returns:
         ExtractionResult with found identifiers
@@ -92,48 +264,19 @@ async def extract_single_url(request: ExtractionRequest):
     Raises:
         HTTPException: If scraping fails
     """
-    start_time = time.time()
+    url = request.url
+    start_time = time.perf_counter()
 
     try:
-        async with PlaywrightScraper() as scraper:
-            identifiers = await scraper.scrape_url(str(request.url))
-
-        processing_time = time.time() - start_time
-
-        # Check if we found at least one identifier
-        success = any(identifiers.values())
-        has_data = any(identifiers.values())
-        error = None if has_data else "No valid identifiers found"
-        status = "success" if success else ("no_data" if not has_data else "error")
-
-        return ExtractionResult(
-            url=str(request.url),
-            siret=identifiers.get('siret'),
-            siren=identifiers.get('siren'),
-            tva=identifiers.get('tva'),
-            success=success,
-            status=status,
-            error=error,
-            processing_time=round(processing_time, 3),
-            worker_id=None,  # Single URL doesn't use workers
-            proxy_used=None  # Single URL endpoint doesn't use proxies
-        )
+        identifiers = await scraper.scrape_url(url)
+
+        # Single URL endpoint doesn't use workers or proxies
+        return _mk_result(url, identifiers, _elapsed_seconds(start_time))
 
     except Exception as e:
-        processing_time = time.time() - start_time
-
-        return ExtractionResult(
-            url=str(request.url),
-            siret=None,
-            siren=None,
-            tva=None,
-            success=False,
-            status="error",
-            error=str(e),
-            processing_time=round(processing_time, 3),
-            worker_id=None,
-            proxy_used=None
-        )
+        processing_time = _elapsed_seconds(start_time)
+
+        return _mk_result(url, _EMPTY_IDS, processing_time, error=_format_error(url, e))
 
 
 @router.get("/api/extract/batch/{batch_id}/progress", response_model=BatchProgress, tags=["Extraction"])
@@ -157,8 +300,7 @@ async def get_batch_progress(batch_id: str):
         )
 
     state = batch_store[batch_id]
-    current_time = time.time()
-    elapsed = current_time - state.start_time
+    elapsed = time.monotonic() - state.start_monotonic
 
     # Calculate estimated time remaining using throughput-based formula
     # This accounts for parallel processing by measuring actual URLs/second rate
@@ -178,10 +320,149 @@ async def get_batch_progress(batch_id: str):
         start_time=state.start_time,
         elapsed_time=elapsed,
         estimated_time_remaining=estimated_remaining,
+        current_concurrency=state.current_concurrency,
         recent_logs=list(state.recent_logs)  # Convert deque to list for JSON serialization
     )
 
 
+async def _progress_events(state: BatchState) -> AsyncIterator[str]:
+    """
+    Yield Server-Sent Events for a batch until it completes.
+
+    Each event carries the current counters and only the log entries added
+    since the previous event. The last event is named "done".
+
+    Args:
+        state: Batch to follow
+
+    Yields:
+        SSE-formatted event strings
+    """
+    changed = asyncio.Event()
+    state.subscribers.add(changed)
+    logs_seen = state.logs_total - len(state.recent_logs)
+    try:
+        while True:
+            changed.clear()
+            done = not state.in_progress
+            new_count = min(state.logs_total - logs_seen, len(state.recent_logs))
+            new_logs = list(state.recent_logs)[-new_count:] if new_count else []
+            logs_seen = state.logs_total
+
+            payload = orjson.dumps({
+                "completed": state.completed,
+                "success": state.success,
+                "failed": state.failed,
+                "total_urls": state.total_urls,
+                "current_concurrency": state.current_concurrency,
+                "new_logs": [entry.model_dump() for entry in new_logs],
+            }).decode()
+            yield f"event: {'done' if done else 'progress'}\ndata: {payload}\n\n"
+
+            if done:
+                return
+
+            # Keep idle connections open through proxies while waiting for changes
+            while True:
+                try:
+                    await asyncio.wait_for(changed.wait(), _SSE_KEEPALIVE)
+                    break
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+    finally:
+        state.subscribers.discard(changed)
+
+
+@router.get("/api/extract/batch/{batch_id}/events", tags=["Extraction"])
+async def stream_batch_progress(batch_id: str):
+    """
+    Stream progress for a batch extraction job as Server-Sent Events.
+
+    Alternative to polling /progress: one "progress" event is pushed per
+    change (with only the new log entries), then a final "done" event.
+
+    Args:
+        batch_id: Unique batch ID returned from batch extraction request
+
+    Returns:
+        StreamingResponse with text/event-stream content
+
+    Raises:
+        HTTPException: If batch_id not found
+    """
+    if batch_id not in batch_store:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch ID {batch_id} not found"
+        )
+
+    return StreamingResponse(
+        _progress_events(batch_store[batch_id]),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+async def _process_one(
+    state: BatchState,
+    scraper: PlaywrightScraper,
+    context: BrowserContext,
+    url: str,
+    index: int,
+    worker_id: int,
+    proxy: WorkerProxy
+) -> ExtractionResult:
+    """
+    Process a single batch URL on behalf of a worker.
+
+    Kept at module level (rather than as a closure in process_batch_background)
+    so everything it touches is a plain local.
+
+    Args:
+        state: Batch being processed (log entries are appended)
+        scraper: Shared scraper for the batch
+        context: The worker's long-lived browser context
+        url: URL to scrape
+        index: Position of the URL in the batch
+        worker_id: Worker processing the URL
+        proxy: Proxy assigned to the worker
+
+    Returns:
+        ExtractionResult for the URL (errors are returned, not raised)
+    """
+    start_time = time.perf_counter()
+    logger.info("[Worker %d] Processing URL %d/%d: %s (%s)", worker_id, index + 1, state.total_urls, url, proxy.display)
+
+    # Add log entry for real-time streaming
+    state.log(url, "processing", f"Worker {worker_id} processing ({proxy.display})", worker_id)
+
+    try:
+        # Use shared scraper with the worker's context (no browser or context launch overhead)
+        identifiers = await scraper.scrape_url(url, proxy=proxy.url, context=context)
+
+        processing_time = _elapsed_seconds(start_time)
+        result = _mk_result(url, identifiers, processing_time, worker_id, proxy.stored)
+
+        status_emoji = _STATUS_EMOJI[result.status]
+        logger.info("[Worker %d] %s Completed %s in %.2fs", worker_id, status_emoji, url, processing_time)
+
+        # Add completion log entry
+        state.log(url, result.status, f"{status_emoji} Completed in {processing_time:.2f}s", worker_id)
+
+        return result
+
+    except Exception as e:
+        processing_time = _elapsed_seconds(start_time)
+        error_msg = _format_error(url, e)
+        status_emoji = _STATUS_EMOJI["error"]
+        logger.error("[Worker %d] %s Error processing %s: %s", worker_id, status_emoji, url, error_msg)
+
+        # Add error log entry (truncate long errors)
+        state.log(url, "error", f"{status_emoji} Error: {error_msg[:100]}", worker_id)
+
+        return _mk_result(url, _EMPTY_IDS, processing_time, worker_id, proxy.stored, error=error_msg)
+
+
 async def process_batch_background(
     batch_id: str,
     urls: List[str],
@@ -190,172 +471,175 @@ async def process_batch_background(
     navigation_timeout: Optional[int] = None,
     page_load_timeout: Optional[int] = None,
     max_retries: Optional[int] = None,
-    retry_delay: Optional[int] = None
+    retry_delay: Optional[int] = None,
+    result_queue: Optional[asyncio.Queue] = None,
+    base_scraper: Optional[PlaywrightScraper] = None
 ):
-    """Background task to process batch URLs"""
-    state = batch_store[batch_id]
+    """
+    Background task to process batch URLs.
 
-    # Create semaphore to limit concurrent workers
-    semaphore = asyncio.Semaphore(concurrent_workers)
+    If result_queue is given, each ExtractionResult is also put on it as soon
+    as it completes (used by the streaming endpoint).
 
-    # Create a SINGLE shared scraper for the entire batch (reuses browser)
+    If base_scraper is given (the app-wide scraper started at startup), the
+    batch runs on its warm browsers with the batch's own settings; otherwise a
+    dedicated browser pool is launched for the batch.
+    """
+    state = batch_store[batch_id]
+    total_urls = len(urls)
+    # Never start more workers (or browsers) than there are URLs
+    concurrent_workers = min(concurrent_workers, total_urls)
+
+    # Create a SINGLE shared scraper for the entire batch (warm browser pool)
     # Pass custom settings if provided
-    scraper = PlaywrightScraper(
-        proxy_manager=proxy_manager,
-        navigation_timeout=navigation_timeout,
-        page_load_timeout=page_load_timeout,
-        max_retries=max_retries,
-        retry_delay=retry_delay
-    )
-    await scraper.start()
-
-    # Pre-assign proxies to workers for consistent distribution
-    worker_proxies = {}
-    if proxy_manager and proxy_manager.proxy_list:
-        for worker_id in range(concurrent_workers):
-            proxy_idx = worker_id % len(proxy_manager.proxy_list)
-            worker_proxies[worker_id] = proxy_manager.proxy_list[proxy_idx]
-            logger.info(f"[Worker {worker_id}] Assigned proxy: {worker_proxies[worker_id][:50]}")
-
-    async def process_url_with_semaphore(url: str, index: int) -> ExtractionResult:
-        """Process a single URL with semaphore to limit concurrency"""
-        async with semaphore:
-            worker_id = index % concurrent_workers
-            start_time = time.time()
-
-            # Get assigned proxy for this worker
-            proxy_used = worker_proxies.get(worker_id) if worker_proxies else None
-            proxy_display = f"Proxy: {proxy_used[:20]}..." if proxy_used else "No proxy"
-            logger.info(f"[Worker {worker_id}] Processing URL {index + 1}/{len(urls)}: {url} ({proxy_display})")
-
-            # Add log entry for real-time streaming
-            state.recent_logs.append(LogEntry(
-                timestamp=time.time(),
-                url=url,
-                status="processing",
-                message=f"Worker {worker_id} processing ({proxy_display})",
-                worker_id=worker_id
-            ))
+    if base_scraper is not None:
+        # Reuse the browsers launched at startup: no cold start per batch
+        scraper = base_scraper.with_options(
+            proxy_manager=proxy_manager,
+            navigation_timeout=navigation_timeout,
+            page_load_timeout=page_load_timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay
+        )
+    else:
+        scraper = PlaywrightScraper(
+            proxy_manager=proxy_manager,
+            navigation_timeout=navigation_timeout,
+            page_load_timeout=page_load_timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            pool_size=concurrent_workers
+        )
 
+    # Pre-assign proxies to workers for consistent distribution: worker N always
+    # uses proxies[N % proxy_count], without going through the proxy manager.
+    # Without batch proxies, the scraper's own (PROXY_LIST) are used: the worker's
+    # context and its static fetches must leave from the same IP
+    if proxy_manager:
+        proxies = tuple(proxy_manager.proxy_list)
+    elif scraper.proxy_manager.is_enabled():
+        proxies = tuple(scraper.proxy_manager.proxy_list)
+    else:
+        proxies = ()
+    proxy_count = len(proxies)
+    worker_proxies = [
+        WorkerProxy.for_url(proxies[worker_id % proxy_count] if proxy_count else None)
+        for worker_id in range(concurrent_workers)
+    ]
+    if proxy_count:
+        for worker_id, proxy in enumerate(worker_proxies):
+            logger.info("[Worker %d] Assigned proxy: %s", worker_id, proxy.stored)
+
+    # Back off when URLs start failing (timeouts, proxy bans), recover on success
+    limiter = AIMDLimiter(concurrent_workers)
+    state.current_concurrency = limiter.limit
+
+    # Fixed set of workers sharing one iterator over the URLs: no per-URL task
+    # objects and no queued copies (next() never awaits, so workers can't race)
+    pending = enumerate(urls)
+
+    def finish(index: int, result: ExtractionResult) -> None:
+        """Record a URL's result, feed it to the limiter and the result queue"""
+        if result.status == "error":
+            limiter.record_failure()
+        else:
+            limiter.record_success()
+        state.current_concurrency = limiter.limit
+        state.record(index, result)
+        if result_queue is not None:
+            result_queue.put_nowait(result)
+
+    async def worker_loop(worker_id: int) -> None:
+        """Pull URLs from the shared iterator until it is exhausted"""
+        proxy = worker_proxies[worker_id]
+        # URLs per context before it is replaced (contexts leak memory over long runs)
+        per_context = settings.context_recycle_after - 1 if settings.context_recycle_after > 0 else None
+
+        while True:
+            # Only open a context once there is a URL for it
+            first = next(pending, None)
+            if first is None:
+                return
+
+            # URL taken from the iterator but not recorded yet
+            current: Optional[Tuple[int, str]] = first
             try:
-                # Use shared scraper with assigned proxy (no browser launch overhead)
-                identifiers = await scraper.scrape_url(url, proxy=proxy_used)
-
-                processing_time = time.time() - start_time
-
-                # Check if we found at least one identifier
-                success = any(identifiers.values())
-                has_data = any(identifiers.values())
-                error = None if has_data else "No valid identifiers found"
-                status_str = "success" if success else ("no_data" if not has_data else "error")
-
-                result = ExtractionResult(
-                    url=url,
-                    siret=identifiers.get('siret'),
-                    siren=identifiers.get('siren'),
-                    tva=identifiers.get('tva'),
-                    success=success,
-                    status=status_str,
-                    error=error,
-                    processing_time=round(processing_time, 3),
-                    worker_id=worker_id,
-                    proxy_used=proxy_used[:50] if proxy_used else None  # Truncate for display
-                )
-
-                status_emoji = "✓" if success else ("⚠" if status_str == "no_data" else "✗")
-                logger.info(f"[Worker {worker_id}] {status_emoji} Completed {url} in {processing_time:.2f}s")
-
-                # Add completion log entry
-                state.recent_logs.append(LogEntry(
-                    timestamp=time.time(),
-                    url=url,
-                    status=status_str,
-                    message=f"{status_emoji} Completed in {processing_time:.2f}s",
-                    worker_id=worker_id
-                ))
-
-                # Update progress
-                state.completed += 1
-                state.results.append(result)
-                if success:
-                    state.success += 1
-                else:
-                    state.failed += 1
-
-                return result
-
+                # One warm context and page per worker, reused for its next URLs;
+                # islice still pulls them one at a time from the shared iterator
+                async with scraper.new_context(proxy=proxy.url) as context:
+                    for current in chain((first,), islice(pending, per_context)):
+                        index, url = current
+                        async with limiter.slot():
+                            result = await _process_one(state, scraper, context, url, index, worker_id, proxy)
+                        finish(index, result)
+                        current = None
             except Exception as e:
-                processing_time = time.time() - start_time
-                error_msg = str(e)
-                logger.error(f"[Worker {worker_id}] ✗ Error processing {url}: {error_msg}")
-
-                # Add error log entry
-                state.recent_logs.append(LogEntry(
-                    timestamp=time.time(),
-                    url=url,
-                    status="error",
-                    message=f"✗ Error: {error_msg[:100]}",  # Truncate long errors
-                    worker_id=worker_id
-                ))
-
-                # Update progress
-                state.completed += 1
-                state.failed += 1
-
-                result = ExtractionResult(
-                    url=url,
-                    siret=None,
-                    siren=None,
-                    tva=None,
-                    success=False,
-                    status="error",
-                    error=error_msg,
-                    processing_time=round(processing_time, 3),
-                    worker_id=worker_id,
-                    proxy_used=proxy_used[:50] if proxy_used else None
-                )
-                state.results.append(result)
-                return result
+                # The context failed to open or close (bad proxy, browser crash):
+                # fail the URL it held and keep going with a new context
+                logger.error("[Worker %d] Browser context failed (%s): %s", worker_id, proxy.display, e)
+                if current is not None:
+                    index, url = current
+                    error_msg = _format_error(url, e)
+                    state.log(url, "error", f"{_STATUS_EMOJI['error']} Error: {error_msg[:100]}", worker_id)
+                    finish(index, _mk_result(url, _EMPTY_IDS, 0.0, worker_id, proxy.stored, error=error_msg))
 
     try:
-        # Process all URLs concurrently with limited workers
-        tasks = [process_url_with_semaphore(url, i) for i, url in enumerate(urls)]
-        await asyncio.gather(*tasks)
-
-        # Mark batch as complete
+        try:
+            await scraper.start()
+        except Exception as e:
+            # No browser: fail every URL so the batch still ends with a result per URL
+            logger.error("[Batch Extract] Could not start browsers for batch %s: %s", batch_id, e)
+            for index, url in pending:
+                finish(index, _mk_result(url, _EMPTY_IDS, 0.0, error=_format_error(url, e)))
+            return
+
+        if concurrent_workers == 1:
+            # Single URL or single worker: run inline, no task scheduling
+            await worker_loop(0)
+        else:
+            # Process all URLs concurrently with limited workers
+            workers = [asyncio.create_task(worker_loop(worker_id)) for worker_id in range(concurrent_workers)]
+            await asyncio.gather(*workers)
+
+        batch_duration = time.monotonic() - state.start_monotonic
+        logger.info("[Batch Extract] Completed %d URLs in %.2fs (%.2fs per URL avg) (Batch ID: %s)",
+                    total_urls, batch_duration, batch_duration / total_urls, batch_id)
+        logger.info("[Batch Extract] Results: %d success, %d failed", state.success, state.failed)
+    finally:
+        # URLs never reached (batch cancelled, e.g. a stream client left) still get
+        # a result, so results always hold one ExtractionResult per URL
+        for index, result in enumerate(state.results):
+            if result is None:
+                state.record(index, _mk_result(urls[index], _EMPTY_IDS, 0.0, error=_BATCH_STOPPED))
+
+        # Mark batch as complete, even if it failed or was cancelled, so progress
+        # streams and the results endpoint don't wait forever
         state.in_progress = False
+        state.notify()
 
-        batch_duration = time.time() - state.start_time
-        logger.info(f"[Batch Extract] Completed {len(urls)} URLs in {batch_duration:.2f}s ({batch_duration/len(urls):.2f}s per URL avg) (Batch ID: {batch_id})")
-        logger.info(f"[Batch Extract] Results: {state.success} success, {state.failed} failed")
-    finally:
-        # Always close the shared scraper to clean up browser resources
+        # Always close the batch scraper to clean up browser resources
+        # (browsers borrowed from the app-wide scraper stay running)
         await scraper.close()
-        logger.info(f"[Batch Extract] Cleaned up browser resources for batch {batch_id}")
+        logger.info("[Batch Extract] Cleaned up browser resources for batch %s", batch_id)
 
+        # Expire the batch (even a failed one) so the store doesn't grow forever
+        asyncio.get_running_loop().call_later(settings.batch_ttl, batch_store.pop, batch_id, None)
 
-@router.post("/api/extract/batch", response_model=BatchStartResponse, tags=["Extraction"])
-async def extract_batch_urls(request: BatchExtractionRequest, background_tasks: BackgroundTasks):
-    """
-    Start batch extraction of SIRET, SIREN, and TVA numbers from multiple URLs.
 
-    This endpoint starts background processing and returns immediately with a batch_id.
-    Use the batch_id to:
-    - Poll /api/extract/batch/{batch_id}/progress for real-time progress
-    - Retrieve /api/extract/batch/{batch_id}/results when complete
+def _register_batch(request: BatchExtractionRequest) -> Tuple[str, List[str], Optional[ProxyManager]]:
+    """
+    Create the batch state and proxy manager for a batch request.
 
     Args:
-        request: BatchExtractionRequest with list of URLs, concurrent_workers, and optional proxies
-        background_tasks: FastAPI BackgroundTasks for async processing
+        request: Validated batch extraction request
 
     Returns:
-        BatchStartResponse with batch_id for tracking
+        Tuple of (batch_id, urls, proxy_manager)
     """
-    urls = [str(url) for url in request.urls]
-    concurrent_workers = request.concurrent_workers
+    urls = list(request.urls)
 
-    # Generate unique batch ID
-    batch_id = str(uuid.uuid4())
+    # Generate unique batch ID: opaque 32-char hex, 128 random bits (a UUID4 has 122)
+    batch_id = secrets.token_hex(16)
 
     # Initialize batch state
     batch_store[batch_id] = BatchState(
@@ -363,28 +647,54 @@ async def extract_batch_urls(request: BatchExtractionRequest, background_tasks:
         total_urls=len(urls)
     )
 
-    logger.info(f"[Batch Extract] Starting batch {batch_id}: {len(urls)} URLs with {concurrent_workers} concurrent workers")
+    logger.info("[Batch Extract] Starting batch %s: %d URLs with %d concurrent workers",
+                batch_id, len(urls), request.concurrent_workers)
 
     # Setup proxy manager if proxies provided
     proxy_manager = None
     if request.proxies and len(request.proxies) > 0:
         proxy_list = [proxy.to_url() for proxy in request.proxies]
         proxy_manager = ProxyManager(proxy_list=proxy_list)
-        logger.info(f"[Batch Extract] Using {len(proxy_list)} proxies for rotation")
+        logger.info("[Batch Extract] Using %d proxies for rotation", len(proxy_list))
     else:
         logger.info("[Batch Extract] No proxies configured, using direct connection")
 
+    return batch_id, urls, proxy_manager
+
+
+@router.post("/api/extract/batch", response_model=BatchStartResponse, tags=["Extraction"])
+async def extract_batch_urls(request: BatchExtractionRequest, background_tasks: BackgroundTasks,
+                             scraper: PlaywrightScraper = Depends(get_scraper)):
+    """
+    Start batch extraction of SIRET, SIREN, and TVA numbers from multiple URLs.
+
+    This endpoint starts background processing and returns immediately with a batch_id.
+    Use the batch_id to:
+    - Poll /api/extract/batch/{batch_id}/progress for real-time progress
+    - Retrieve /api/extract/batch/{batch_id}/results when complete
+
+    Args:
+        request: BatchExtractionRequest with list of URLs, concurrent_workers, and optional proxies
+        background_tasks: FastAPI BackgroundTasks for async processing
+        scraper: Shared app-wide PlaywrightScraper whose browsers the batch reuses
+
+    Returns:
+        BatchStartResponse with batch_id for tracking
+    """
+    batch_id, urls, proxy_manager = _register_batch(request)
+
     # Start background processing with custom settings from request
     background_tasks.add_task(
         process_batch_background,
         batch_id,
         urls,
-        concurrent_workers,
+        request.concurrent_workers,
         proxy_manager,
         request.navigation_timeout,
         request.page_load_timeout,
         request.max_retries,
-        request.retry_delay
+        request.retry_delay,
+        base_scraper=scraper
     )
 
     return BatchStartResponse(
@@ -394,6 +704,64 @@ async def extract_batch_urls(request: BatchExtractionRequest, background_tasks:
     )
 
 
+@router.post("/api/extract/batch/stream", tags=["Extraction"])
+async def extract_batch_stream(request: BatchExtractionRequest, scraper: PlaywrightScraper = Depends(get_scraper)):
+    """
+    Run a batch extraction and stream results as they complete.
+
+    The response is newline-delimited JSON (one ExtractionResult per line) in
+    completion order, so clients get the first results without waiting for the
+    slowest URL. If the batch itself fails, a last {"batch_id", "error"} line
+    says so. The batch is also registered like a regular batch: the
+    X-Batch-ID header can be used with the progress and results endpoints.
+
+    Args:
+        request: BatchExtractionRequest with list of URLs, concurrent_workers, and optional proxies
+        scraper: Shared app-wide PlaywrightScraper whose browsers the batch reuses
+
+    Returns:
+        StreamingResponse with application/x-ndjson content
+    """
+    batch_id, urls, proxy_manager = _register_batch(request)
+    result_queue: asyncio.Queue = asyncio.Queue()
+
+    async def stream_results():
+        task = asyncio.create_task(process_batch_background(
+            batch_id,
+            urls,
+            request.concurrent_workers,
+            proxy_manager,
+            request.navigation_timeout,
+            request.page_load_timeout,
+            request.max_retries,
+            request.retry_delay,
+            result_queue=result_queue,
+            base_scraper=scraper
+        ))
+        # Sentinel once the batch finishes, whether it succeeded or not
+        task.add_done_callback(lambda _: result_queue.put_nowait(None))
+
+        try:
+            while (result := await result_queue.get()) is not None:
+                yield result.model_dump_json() + "\n"
+
+            # The batch task ended: end with an error line rather than a silently short stream
+            error = None if task.cancelled() else task.exception()
+            if error is not None:
+                logger.error("[Batch Extract] Batch %s failed: %s", batch_id, error, exc_info=error)
+                yield orjson.dumps({"batch_id": batch_id, "error": f"{type(error).__name__}: {error}"}).decode() + "\n"
+        finally:
+            # Stop scraping if the client disconnected mid-stream
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        stream_results(),
+        media_type="application/x-ndjson",
+        headers={"X-Batch-ID": batch_id}
+    )
+
+
 @router.get("/api/extract/batch/{batch_id}/results", response_model=BatchExtractionResponse, tags=["Extraction"])
 async def get_batch_results(batch_id: str):
     """
@@ -422,10 +790,13 @@ async def get_batch_results(batch_id: str):
             detail=f"Batch {batch_id} is still in progress. Use /progress endpoint to check status."
         )
 
-    return BatchExtractionResponse(
+    # Results were built by our own code: serialize them in one pass instead of
+    # letting FastAPI dump, re-validate and re-serialize every result
+    response = BatchExtractionResponse.model_construct(
         batch_id=state.batch_id,
         results=state.results,
-        total=len(state.results),
+        total=state.total_urls,
         successful=state.success,
         failed=state.failed
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
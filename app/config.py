@@ -1,9 +1,11 @@
 """Configuration management for SIRET Extractor API"""
 
 import os
+import re
+from functools import lru_cache
 from typing import List, Optional, Union
 from pydantic_settings import BaseSettings
-from pydantic import Field, validator
+from pydantic import Field, field_validator
 
 
 class Settings(BaseSettings):
@@ -21,6 +23,10 @@ class Settings(BaseSettings):
     request_timeout: int = Field(default=30000, env="REQUEST_TIMEOUT")
     navigation_timeout: int = Field(default=20000, env="NAVIGATION_TIMEOUT")  # Reduced from 60s to 20s
     page_load_timeout: int = Field(default=10000, env="PAGE_LOAD_TIMEOUT")  # Reduced from 30s to 10s
+    static_fetch_enabled: bool = Field(default=True, env="STATIC_FETCH_ENABLED")  # Plain HTTP fetch before Playwright
+    static_fetch_timeout: int = Field(default=5000, env="STATIC_FETCH_TIMEOUT")
+    static_skip_browser: bool = Field(default=True, env="STATIC_SKIP_BROWSER")  # No browser when all fetched pages were server-rendered
+    batch_ttl: int = Field(default=86400, env="BATCH_TTL")  # Seconds a batch is kept after it ends
 
     # Proxy Configuration
     proxy_list: List[str] = Field(default_factory=list, env="PROXY_LIST")
@@ -43,8 +49,13 @@ class Settings(BaseSettings):
     # Browser Configuration
     headless: bool = Field(default=True, env="HEADLESS")
     browser_type: str = Field(default="chromium", env="BROWSER_TYPE")
+    browser_pool_size: int = Field(default=1, env="BROWSER_POOL_SIZE")  # Warm browsers per API worker process
+    browser_recycle_after: int = Field(default=50, env="BROWSER_RECYCLE_AFTER")  # Contexts per browser before relaunch
+    context_recycle_after: int = Field(default=25, env="CONTEXT_RECYCLE_AFTER")  # URLs per worker context (0 = never)
+    block_resources: bool = Field(default=True, env="BLOCK_RESOURCES")  # Abort BLOCKED_RESOURCE_TYPES requests
 
-    @validator("allowed_origins", pre=True)
+    @field_validator("allowed_origins", mode="before")
+    @classmethod
     def parse_allowed_origins(cls, v):
         """Parse comma-separated allowed origins from environment variable"""
         if isinstance(v, str):
@@ -55,7 +66,8 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v if isinstance(v, list) else ["*"]
 
-    @validator("proxy_list", pre=True)
+    @field_validator("proxy_list", mode="before")
+    @classmethod
     def parse_proxy_list(cls, v):
         """Parse comma-separated proxy list from environment variable"""
         if isinstance(v, str):
@@ -64,7 +76,8 @@ class Settings(BaseSettings):
             return [proxy.strip() for proxy in v.split(",") if proxy.strip()]
         return v
 
-    @validator("browser_type")
+    @field_validator("browser_type")
+    @classmethod
     def validate_browser_type(cls, v):
         """Validate browser type"""
         valid_types = ["chromium", "firefox", "webkit"]
@@ -78,15 +91,28 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings (environment and .env are read once)"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 
 # Extraction Patterns (allow spaces/nbsp between digit groups)
 # Examples: "423 757 418 00011" or "423757418" or "423&nbsp;757&nbsp;418"
-SIRET_PATTERN = r'\b(?:\d{3}\s*){2}\d{3}\s*\d{5}\b'
-SIREN_PATTERN = r'\b(?:\d{3}\s*){3}\b'
-TVA_PATTERN = r'\bFR\s*\d{2}\s*\d{9}\b'
+# Gaps are bounded to 3 whitespace chars: real identifiers use one space/nbsp,
+# and the bound keeps each match attempt short on whitespace-heavy pages
+SIRET_PATTERN = r'\b(?:\d{3}\s{0,3}){2}\d{3}\s{0,3}\d{5}\b'
+SIREN_PATTERN = r'\b(?:\d{3}\s{0,3}){3}\b'
+TVA_PATTERN = r'\bFR\s{0,3}\d{2}\s{0,3}\d{9}\b'
+
+# Compiled once at import for the extraction hot path
+SIRET_RE = re.compile(SIRET_PATTERN)
+SIREN_RE = re.compile(SIREN_PATTERN)
+TVA_RE = re.compile(TVA_PATTERN, re.IGNORECASE)
 
 # Validation
 SIRET_LENGTH = 14
@@ -117,6 +143,38 @@ SEARCH_SELECTORS = [
     "body",
 ]
 
+# Resource types aborted when block_resources is on (only page text is needed);
+# matched through CDP request interception on Chromium, page routing elsewhere
+BLOCKED_RESOURCE_TYPES = frozenset({
+    "image",
+    "media",
+    "font",
+    "stylesheet",
+    "websocket",
+    "manifest",
+})
+
+# URL patterns blocked through CDP on Chromium before the request is even sent (same
+# resources, matched by extension; anchored at the end or before a query so hostnames
+# like "www.png-xyz.fr" pass). Assets without an extension (image CDNs, font APIs)
+# are caught by resource type instead, see BLOCKED_RESOURCE_TYPES
+BLOCKED_URL_PATTERNS = tuple(
+    pattern
+    for extension in (
+        "png", "jpg", "jpeg", "gif", "webp", "svg", "ico",
+        "woff", "woff2", "ttf", "otf", "eot",
+        "mp4", "webm", "mp3",
+        "css",
+    )
+    for pattern in (f"*.{extension}", f"*.{extension}?*")
+)
+
+# Grouped form of SEARCH_SELECTORS, so the DOM is walked once per page
+SEARCH_SELECTORS_JOINED = ", ".join(SEARCH_SELECTORS)
+
+# A page is ready to read once any priority section (other than body) exists
+CONTENT_READY_SELECTOR = ", ".join(selector for selector in SEARCH_SELECTORS if selector != "body")
+
 # Common French Legal Terms
 LEGAL_KEYWORDS = [
     "siret",
@@ -130,7 +188,7 @@ LEGAL_KEYWORDS = [
 ]
 
 # Legal Pages to Check (ordered by priority)
-LEGAL_PATHS = [
+LEGAL_PATHS = (
     "/mentions-legales",
     "/mentions-legales/",
     "/mentions",
@@ -152,13 +210,17 @@ LEGAL_PATHS = [
     "/fr/conditions-generales",
     "/legal",
     "/legal/",
-]
+)
+
+# LEGAL_PATHS in order, without trailing-slash duplicates (servers normally redirect
+# between the two forms, so probing both would spend MAX_LEGAL_PAGES_TO_CHECK twice)
+LEGAL_PATHS_UNIQUE = tuple(dict.fromkeys(path.rstrip("/") for path in LEGAL_PATHS))
 
 # Maximum number of legal pages to check per site
 MAX_LEGAL_PAGES_TO_CHECK = 5
 
-# Blacklist of hosting/agency SIRENs to exclude
-BLACKLIST_SIRENS = [
+# Blacklist of hosting/agency SIRENs to exclude (frozenset: O(1) membership checks)
+BLACKLIST_SIRENS = frozenset({
     "797876562",  # Gestixi (site builder)
     "423646512",  # OVH (hosting)
     "537407926",  # Gandi (domain/hosting)
@@ -169,4 +231,4 @@ BLACKLIST_SIRENS = [
     "890176703",  # WordPress.com (Automattic)
     "433115904",  # Adobe (Creative Cloud)
     "732829320",  # Hostinger
-]
+})
@@ -2,20 +2,20 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Tuple
 import logging
 
 from app.api.routes import router
 from app.config import settings
 from app import __version__
-from app.scraper.proxy_loader import load_proxies_from_csv
-from app.scraper.proxy_manager import ProxyManager, distribute_proxies_to_workers
+from app.scraper import PlaywrightScraper
+from app.scraper.proxy_manager import ProxyManager, NO_PROXY_MANAGER
 
 logger = logging.getLogger(__name__)
 
-# Global proxy managers for workers
-proxy_managers: List[ProxyManager] = []
+# Global proxy managers for workers (fixed after startup, hence a tuple)
+proxy_managers: Tuple[ProxyManager, ...] = ()
 loaded_proxies: List[str] = []
 
 
@@ -29,8 +29,9 @@ def get_proxy_manager(worker_id: int = 0) -> Optional[ProxyManager]:
     Returns:
         ProxyManager instance or None if not available
     """
-    if 0 <= worker_id < len(proxy_managers):
-        return proxy_managers[worker_id]
+    managers = proxy_managers
+    if 0 <= worker_id < len(managers):
+        return managers[worker_id]
     return None
 
 
@@ -57,6 +58,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -75,7 +77,7 @@ app.include_router(router)
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -89,6 +91,10 @@ async def startup_event():
     """Actions to perform on application startup"""
     global proxy_managers, loaded_proxies
 
+    # Only needed once, at startup
+    from app.scraper.proxy_loader import load_proxies_from_csv
+    from app.scraper.proxy_manager import distribute_proxies_to_workers
+
     logger.info(f"Starting SIRET Extractor API v{__version__}")
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Max concurrent workers: {settings.max_concurrent_workers}")
@@ -108,24 +114,37 @@ async def startup_event():
             logger.info(f"Distributed proxies among {len(proxy_managers)} workers")
         else:
             logger.warning("No proxies loaded - running without proxy rotation")
-            # Create empty proxy managers for workers
-            proxy_managers = [ProxyManager(proxy_list=[], worker_id=i)
-                            for i in range(settings.max_concurrent_workers)]
+            # All workers share the empty proxy manager
+            proxy_managers = (NO_PROXY_MANAGER,) * settings.max_concurrent_workers
     except Exception as e:
         logger.error(f"Error loading proxies: {e}")
         logger.warning("Continuing without proxies")
-        proxy_managers = [ProxyManager(proxy_list=[], worker_id=i)
-                        for i in range(settings.max_concurrent_workers)]
+        proxy_managers = (NO_PROXY_MANAGER,) * settings.max_concurrent_workers
         loaded_proxies = []
 
+    proxy_managers = tuple(proxy_managers)
     logger.info(f"Proxy rotation enabled: {len(loaded_proxies) > 0}")
+
+    # Launch the shared browser pool once for the whole process (batches reuse it)
+    app.state.scraper = PlaywrightScraper(pool_size=settings.browser_pool_size)
+    try:
+        await app.state.scraper.start()
+        logger.info("Shared browser started")
+    except Exception as e:
+        logger.error(f"Error starting browser: {e}")
+        logger.warning("Browser will be started on first request")
+
     logger.info("API ready to accept requests")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Actions to perform on application shutdown"""
-    print("Shutting down SIRET Extractor API")
+    logger.info("Shutting down SIRET Extractor API")
+
+    scraper = getattr(app.state, "scraper", None)
+    if scraper is not None:
+        await scraper.close()
 
 
 if __name__ == "__main__":
@@ -137,4 +156,6 @@ if __name__ == "__main__":
         port=settings.api_port,
         reload=settings.debug,
         workers=1 if settings.debug else settings.api_workers,
+        loop="uvloop",
+        http="httptools",
     )
@@ -1,12 +1,24 @@
 """Pydantic models for request/response validation"""
 
+import re
 from typing import List, Optional
-from pydantic import BaseModel, HttpUrl, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+# Cheap http(s) URL shape check for submitted URLs (HttpUrl fully parses each one)
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
 
 
 class ExtractionRequest(BaseModel):
     """Single URL extraction request"""
-    url: HttpUrl = Field(..., description="URL to extract SIRET/SIREN/TVA from")
+    url: str = Field(..., description="URL to extract SIRET/SIREN/TVA from")
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, v):
+        """Ensure the URL is a well-formed http(s) URL"""
+        if not _URL_RE.match(v):
+            raise ValueError(f"Invalid URL: {v}")
+        return v
 
     class Config:
         json_schema_extra = {
@@ -17,32 +29,40 @@ class ExtractionRequest(BaseModel):
 
 
 class ProxyConfig(BaseModel):
-    """Proxy configuration"""
+    """Proxy configuration (frozen: the formatted forms below are cached)"""
     host: str = Field(..., description="Proxy host")
     port: int = Field(..., description="Proxy port")
     username: Optional[str] = Field(None, description="Proxy username")
     password: Optional[str] = Field(None, description="Proxy password")
 
-    def to_playwright_format(self) -> dict:
-        """Convert to Playwright proxy format"""
-        proxy_dict = {
-            "server": f"http://{self.host}:{self.port}"
-        }
+    _playwright_format: dict = PrivateAttr()
+    _url: str = PrivateAttr()
+
+    class Config:
+        frozen = True
+
+    def model_post_init(self, __context) -> None:
+        """Build both formatted forms once, from the (frozen) fields"""
+        server = f"http://{self.host}:{self.port}"
+        self._playwright_format = {"server": server}
+        self._url = server
         if self.username and self.password:
-            proxy_dict["username"] = self.username
-            proxy_dict["password"] = self.password
-        return proxy_dict
+            self._playwright_format["username"] = self.username
+            self._playwright_format["password"] = self.password
+            self._url = f"http://{self.username}:{self.password}@{self.host}:{self.port}"
+
+    def to_playwright_format(self) -> dict:
+        """Convert to Playwright proxy format (shared dict, do not mutate)"""
+        return self._playwright_format
 
     def to_url(self) -> str:
         """Convert to URL format for ProxyManager"""
-        if self.username and self.password:
-            return f"http://{self.username}:{self.password}@{self.host}:{self.port}"
-        return f"http://{self.host}:{self.port}"
+        return self._url
 
 
 class BatchExtractionRequest(BaseModel):
     """Batch URL extraction request"""
-    urls: List[HttpUrl] = Field(..., min_length=1, max_length=100, description="List of URLs to process")
+    urls: List[str] = Field(..., min_length=1, max_length=100, description="List of URLs to process")
     concurrent_workers: int = Field(10, ge=1, le=50, description="Number of concurrent workers (1-50)")
     proxies: Optional[List[ProxyConfig]] = Field(None, description="Optional list of proxies for rotation")
 
@@ -54,11 +74,17 @@ class BatchExtractionRequest(BaseModel):
     max_retries: Optional[int] = Field(3, ge=0, le=10, description="Maximum retry attempts (0-10, default 3)")
     retry_delay: Optional[int] = Field(2, ge=1, le=10, description="Delay between retries in seconds (1-10s, default 2s)")
 
-    @validator("urls")
-    def validate_unique_urls(cls, v):
-        """Ensure URLs are unique"""
-        if len(v) != len(set(str(url) for url in v)):
-            raise ValueError("URLs must be unique")
+    @field_validator("urls")
+    @classmethod
+    def validate_urls(cls, v):
+        """Ensure URLs are well-formed http(s) URLs and unique, in a single pass"""
+        seen = set()
+        for url in v:
+            if not _URL_RE.match(url):
+                raise ValueError(f"Invalid URL: {url}")
+            if url in seen:
+                raise ValueError("URLs must be unique")
+            seen.add(url)
         return v
 
     class Config:
@@ -99,6 +125,8 @@ class ExtractionResult(BaseModel):
     proxy_used: Optional[str] = Field(None, description="Proxy used for this request")
 
     class Config:
+        # Response-only: built with model_construct, never mutated afterwards
+        frozen = True
         json_schema_extra = {
             "example": {
                 "url": "https://example.fr",
@@ -124,7 +152,7 @@ class BatchStartResponse(BaseModel):
     class Config:
         json_schema_extra = {
             "example": {
-                "batch_id": "550e8400-e29b-41d4-a716-446655440000",
+                "batch_id": "3f2a9c1e7b5d4e8fa1c2d3e4f5a6b7c8",
                 "message": "Batch processing started",
                 "total_urls": 10
             }
@@ -140,9 +168,10 @@ class BatchExtractionResponse(BaseModel):
     failed: int = Field(..., description="Number of failed extractions")
 
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
-                "batch_id": "550e8400-e29b-41d4-a716-446655440000",
+                "batch_id": "3f2a9c1e7b5d4e8fa1c2d3e4f5a6b7c8",
                 "results": [
                     {
                         "url": "https://example1.fr",
@@ -192,6 +221,10 @@ class LogEntry(BaseModel):
     message: str = Field(..., description="Log message")
     worker_id: Optional[int] = Field(None, description="Worker ID that processed this URL")
 
+    class Config:
+        # Built with model_construct by BatchState.log, never mutated afterwards
+        frozen = True
+
 
 class BatchProgress(BaseModel):
     """Real-time progress tracking for batch extraction"""
@@ -204,12 +237,13 @@ class BatchProgress(BaseModel):
     start_time: float = Field(..., description="Start time (Unix timestamp)")
     elapsed_time: float = Field(..., description="Elapsed time in seconds")
     estimated_time_remaining: Optional[float] = Field(None, description="Estimated time remaining in seconds")
+    current_concurrency: Optional[int] = Field(None, description="Workers currently allowed to scrape (lowered while URLs fail)")
     recent_logs: List[LogEntry] = Field(default_factory=list, description="Recent processing logs (last 50)")
 
     class Config:
         json_schema_extra = {
             "example": {
-                "batch_id": "550e8400-e29b-41d4-a716-446655440000",
+                "batch_id": "3f2a9c1e7b5d4e8fa1c2d3e4f5a6b7c8",
                 "total_urls": 10,
                 "completed": 5,
                 "success": 4,
@@ -217,6 +251,7 @@ class BatchProgress(BaseModel):
                 "in_progress": True,
                 "start_time": 1234567890.123,
                 "elapsed_time": 15.5,
-                "estimated_time_remaining": 15.5
+                "estimated_time_remaining": 15.5,
+                "current_concurrency": 4
             }
         }
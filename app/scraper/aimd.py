@@ -0,0 +1,87 @@
+"""Adaptive (AIMD) concurrency limiter"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Optional
+
+
+class AIMDLimiter:
+    """
+    Concurrency limit that adapts to the failure rate.
+
+    Additive increase, multiplicative decrease: the limit grows by one after
+    `limit` consecutive successes and is halved on failure, at most once per
+    window of `limit` outcomes so a burst of failures only counts once.
+    """
+
+    def __init__(self, limit: int, min_limit: int = 1, max_limit: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            limit: Initial number of concurrent holders
+            min_limit: Lowest limit reached when backing off
+            max_limit: Highest limit reached when growing (defaults to limit)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit if max_limit is not None else limit)
+        self.limit = min(max(limit, self.min_limit), self.max_limit)
+        self.active = 0
+        self._successes = 0
+        self._since_decrease = self.limit
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters in FIFO order"""
+        while self._waiters and self.active < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    async def _acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self.active -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the `limit` slots for the duration of the block"""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def record_success(self) -> None:
+        """Count a success, growing the limit by one after a full window"""
+        self._since_decrease += 1
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_limit:
+            self._successes = 0
+            self.limit += 1
+            self._wake()
+
+    def record_failure(self) -> None:
+        """Count a failure, halving the limit (once per window)"""
+        self._successes = 0
+        if self._since_decrease < self.limit:
+            self._since_decrease += 1
+            return
+        self._since_decrease = 0
+        self.limit = max(self.min_limit, self.limit // 2)
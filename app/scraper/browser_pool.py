@@ -0,0 +1,128 @@
+"""Pool of pre-launched browsers with periodic recycling"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from playwright.async_api import Browser, BrowserType
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BrowserSlot:
+    """A pooled browser and its usage counters"""
+    browser: Browser
+    active: int = 0
+    served: int = 0
+    retired: bool = False
+
+
+class BrowserPool:
+    """
+    Fixed-size pool of warm browsers shared by many contexts.
+
+    Each browser is relaunched after serving `recycle_after` contexts so that
+    long batches don't accumulate renderer memory. Retired browsers are closed
+    once their in-flight contexts have finished.
+    """
+
+    def __init__(self, browser_type: BrowserType, size: int = 1,
+                 recycle_after: Optional[int] = None,
+                 launch_options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the browser pool.
+
+        Args:
+            browser_type: Playwright browser type used to launch browsers
+            size: Number of browsers to keep warm
+            recycle_after: Contexts served before a browser is relaunched (0 disables recycling)
+            launch_options: Keyword arguments passed to browser_type.launch()
+        """
+        self.browser_type = browser_type
+        self.size = max(1, size)
+        self.recycle_after = recycle_after if recycle_after is not None else settings.browser_recycle_after
+        self.launch_options = launch_options or {}
+        self._slots: List[_BrowserSlot] = []
+        self._background: Set[asyncio.Task] = set()
+
+    async def _launch(self) -> Browser:
+        return await self.browser_type.launch(**self.launch_options)
+
+    async def start(self) -> None:
+        """Launch all browsers in the pool"""
+        if self._slots:
+            return
+        browsers = await asyncio.gather(*(self._launch() for _ in range(self.size)))
+        self._slots = [_BrowserSlot(browser) for browser in browsers]
+
+    async def close(self) -> None:
+        """Close every browser, including those still being recycled"""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        slots, self._slots = self._slots, []
+        await asyncio.gather(*(slot.browser.close() for slot in slots), return_exceptions=True)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _close_slot(self, slot: _BrowserSlot) -> None:
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            logger.warning("Failed to close recycled browser: %s", e)
+
+    async def _replace(self, slot: _BrowserSlot) -> None:
+        """Launch a fresh browser, swap it in, then close the retired one"""
+        try:
+            browser = await self._launch()
+        except Exception as e:
+            # Keep serving from the old browser rather than shrinking the pool
+            logger.error("Failed to relaunch pooled browser: %s", e)
+            slot.retired = False
+            slot.served = 0
+            return
+
+        if slot not in self._slots:
+            # Pool was closed while relaunching
+            await browser.close()
+            return
+
+        self._slots[self._slots.index(slot)] = _BrowserSlot(browser)
+        logger.info("Recycled pooled browser after %d contexts", slot.served)
+        if slot.active == 0:
+            await self._close_slot(slot)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Browser]:
+        """
+        Borrow the least busy browser from the pool.
+
+        Browsers are shared: several contexts can be open on the same browser.
+
+        Yields:
+            Browser instance
+        """
+        if not self._slots:
+            await self.start()
+
+        candidates = [slot for slot in self._slots if not slot.retired] or self._slots
+        slot = min(candidates, key=lambda s: s.active)
+        slot.active += 1
+        try:
+            yield slot.browser
+        finally:
+            slot.active -= 1
+            slot.served += 1
+            if slot.retired:
+                if slot.active == 0 and slot not in self._slots:
+                    self._spawn(self._close_slot(slot))
+            elif self.recycle_after and slot.served >= self.recycle_after:
+                slot.retired = True
+                self._spawn(self._replace(slot))
@@ -1,9 +1,41 @@
 """Extractors for SIRET, SIREN, and TVA numbers from text content"""
 
+import html
 import re
 from typing import Dict, Optional, List
-from app.config import SIRET_PATTERN, SIREN_PATTERN, TVA_PATTERN, BLACKLIST_SIRENS
-from .validators import validate_siret, validate_siren, validate_tva, extract_siren_from_siret
+from app.config import SIRET_RE, SIREN_RE, TVA_RE, BLACKLIST_SIRENS
+from .validators import SEPARATORS_TABLE, validate_siret, validate_siren, validate_tva, extract_siren_from_siret
+
+
+# Script/style bodies and tags, removed when turning raw HTML into text
+_NON_TEXT_BLOCKS = re.compile(r'<(script|style|noscript)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r'<[^>]+>')
+
+
+def has_identifiers(identifiers: Dict[str, Optional[str]]) -> bool:
+    """Check whether an extraction result holds at least one identifier"""
+    return bool(identifiers['siret'] or identifiers['siren'] or identifiers['tva'])
+
+
+def html_to_text(markup: str) -> str:
+    """
+    Convert raw HTML to plain text for identifier extraction.
+
+    This is a cheap approximation of the rendered text (no layout, no JS):
+    enough for the regexes, which only need digits separated by whitespace.
+
+    Args:
+        markup: Raw HTML document
+
+    Returns:
+        Text content with tags removed and entities decoded
+    """
+    if not markup:
+        return ""
+
+    text = _NON_TEXT_BLOCKS.sub(' ', markup)
+    text = _TAGS.sub(' ', text)
+    return html.unescape(text)
 
 
 def extract_siret_candidates(text: str) -> List[str]:
@@ -19,9 +51,9 @@ def extract_siret_candidates(text: str) -> List[str]:
     if not text:
         return []
 
-    candidates = re.findall(SIRET_PATTERN, text)
+    candidates = SIRET_RE.findall(text)
     # Remove all whitespace for validation
-    return [re.sub(r'\s+', '', c) for c in candidates]
+    return [c.translate(SEPARATORS_TABLE) for c in candidates]
 
 
 def extract_siren_candidates(text: str) -> List[str]:
@@ -37,9 +69,9 @@ def extract_siren_candidates(text: str) -> List[str]:
     if not text:
         return []
 
-    candidates = re.findall(SIREN_PATTERN, text)
+    candidates = SIREN_RE.findall(text)
     # Remove all whitespace for validation
-    return [re.sub(r'\s+', '', c) for c in candidates]
+    return [c.translate(SEPARATORS_TABLE) for c in candidates]
 
 
 def extract_tva_candidates(text: str) -> List[str]:
@@ -56,12 +88,12 @@ def extract_tva_candidates(text: str) -> List[str]:
         return []
 
     # Find TVA numbers (pattern allows spaces)
-    candidates = re.findall(TVA_PATTERN, text, re.IGNORECASE)
+    candidates = TVA_RE.findall(text)
 
     # Clean up candidates: remove spaces and uppercase
     cleaned = []
     for tva in candidates:
-        tva_clean = re.sub(r'\s+', '', tva).upper()
+        tva_clean = tva.translate(SEPARATORS_TABLE).upper()
         cleaned.append(tva_clean)
 
     return cleaned
@@ -161,7 +193,7 @@ def search_in_priority_areas(page_content: str, priority_sections: List[str]) ->
         if section:
             identifiers = extract_identifiers(section)
             # If we found at least one identifier, return
-            if any(identifiers.values()):
+            if has_identifiers(identifiers):
                 return identifiers
 
     # Fall back to full page content
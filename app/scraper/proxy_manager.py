@@ -2,7 +2,8 @@
 
 import random
 import logging
-from typing import List, Optional
+from itertools import cycle
+from typing import Iterator, List, Optional
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -21,11 +22,17 @@ class ProxyManager:
         """
         self.proxy_list = proxy_list or settings.proxy_list
         self.worker_id = worker_id
-        self.current_index = 0
         self.enabled = settings.proxy_rotation_enabled and len(self.proxy_list) > 0
+        # Round-robin iterator over a snapshot of proxy_list (rebuilt when it changes)
+        self._rotation: Optional[Iterator[str]] = None
+        self._reset_rotation()
 
         if self.enabled and worker_id is not None:
-            logger.info(f"Worker {worker_id}: Initialized with {len(self.proxy_list)} proxies")
+            logger.info("Worker %d: Initialized with %d proxies", worker_id, len(self.proxy_list))
+
+    def _reset_rotation(self) -> None:
+        """Restart the round-robin over the current proxy list"""
+        self._rotation = cycle(tuple(self.proxy_list)) if self.proxy_list else None
 
     def get_next_proxy(self) -> Optional[str]:
         """
@@ -34,12 +41,10 @@ class ProxyManager:
         Returns:
             Proxy URL or None if no proxies available
         """
-        if not self.enabled or not self.proxy_list:
+        if not self.enabled or self._rotation is None:
             return None
 
-        proxy = self.proxy_list[self.current_index]
-        self.current_index = (self.current_index + 1) % len(self.proxy_list)
-        return proxy
+        return next(self._rotation)
 
     def get_random_proxy(self) -> Optional[str]:
         """
@@ -63,6 +68,7 @@ class ProxyManager:
         if proxy not in self.proxy_list:
             self.proxy_list.append(proxy)
             self.enabled = True
+            self._reset_rotation()
 
     def remove_proxy(self, proxy: str) -> None:
         """
@@ -74,9 +80,7 @@ class ProxyManager:
         if proxy in self.proxy_list:
             self.proxy_list.remove(proxy)
             self.enabled = len(self.proxy_list) > 0
-            # Reset index if needed
-            if self.current_index >= len(self.proxy_list):
-                self.current_index = 0
+            self._reset_rotation()
 
     def get_proxy_count(self) -> int:
         """
@@ -97,6 +101,12 @@ class ProxyManager:
         return self.enabled
 
 
+# Shared by every worker when no proxies were loaded: the workers would otherwise
+# each get an identical empty manager. Round-robin state is only touched between
+# awaits, so sharing it across worker coroutines is safe.
+NO_PROXY_MANAGER = ProxyManager(proxy_list=[])
+
+
 def distribute_proxies_to_workers(proxy_list: List[str], num_workers: int, proxies_per_worker: int) -> List[ProxyManager]:
     """
     Distribute proxies among workers, creating dedicated ProxyManager instances.
@@ -116,7 +126,7 @@ def distribute_proxies_to_workers(proxy_list: List[str], num_workers: int, proxi
     """
     if not proxy_list:
         logger.warning("No proxies available for distribution")
-        return [ProxyManager(proxy_list=[], worker_id=i) for i in range(num_workers)]
+        return [NO_PROXY_MANAGER] * num_workers
 
     proxy_managers = []
     total_proxies_needed = num_workers * proxies_per_worker
@@ -132,5 +142,6 @@ def distribute_proxies_to_workers(proxy_list: List[str], num_workers: int, proxi
         proxy_manager = ProxyManager(proxy_list=worker_proxies, worker_id=worker_id)
         proxy_managers.append(proxy_manager)
 
-    logger.info(f"Distributed {len(proxy_list)} proxies among {num_workers} workers ({proxies_per_worker} proxies/worker)")
+    logger.info("Distributed %d proxies among %d workers (%d proxies/worker)",
+                len(proxy_list), num_workers, proxies_per_worker)
     return proxy_managers
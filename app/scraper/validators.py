@@ -1,9 +1,22 @@
 """Validators for SIRET, SIREN, and TVA numbers using Luhn algorithm"""
 
-import re
+from functools import lru_cache
 from typing import Optional
 from app.config import SIRET_LENGTH, SIREN_LENGTH, TVA_PREFIX, TVA_LENGTH
 
+# str.translate table deleting the separators allowed between digit groups: every
+# character `\s` matches (all Unicode whitespace lies below U+3001) and dashes.
+# Also used by the extractors, so candidates are normalized in one C-level pass
+SEPARATORS_TABLE = dict.fromkeys(c for c in range(0x3001) if chr(c).isspace() or chr(c) == '-')
+
+# Luhn digit values: as-is, and doubled with the digits of the product summed
+_DIGIT_VALUES = dict(zip("0123456789", range(10)))
+_DOUBLED_DIGIT_VALUES = dict(zip("0123456789", (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+
+# Validators are pure and pages repeat the same numbers (footer, legal pages,
+# retries), so results are memoized; the extractors pass normalized candidates
+_VALIDATION_CACHE_SIZE = 16384
+
 
 def luhn_checksum(number: str) -> bool:
     """
@@ -15,20 +28,18 @@ def luhn_checksum(number: str) -> bool:
     Returns:
         True if the number passes Luhn validation, False otherwise
     """
-    def digits_of(n: str) -> list:
-        return [int(d) for d in n]
-
-    digits = digits_of(number)
-    odd_digits = digits[-1::-2]
-    even_digits = digits[-2::-2]
+    if not number.isascii():
+        # Other Unicode decimal digits (e.g. fullwidth), mapped to ASCII
+        number = ''.join(str(int(digit)) for digit in number)
 
-    checksum = sum(odd_digits)
-    for d in even_digits:
-        checksum += sum(digits_of(str(d * 2)))
+    # Every second digit from the right is doubled; the lookups run in C via map
+    checksum = (sum(map(_DIGIT_VALUES.__getitem__, number[-1::-2]))
+                + sum(map(_DOUBLED_DIGIT_VALUES.__getitem__, number[-2::-2])))
 
     return checksum % 10 == 0
 
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
 def validate_siret(siret: str) -> bool:
     """
     Validate a SIRET number.
@@ -44,8 +55,9 @@ def validate_siret(siret: str) -> bool:
     if not siret:
         return False
 
-    # Remove any spaces or dashes
-    siret = re.sub(r'[\s-]', '', siret)
+    # Remove any spaces or dashes (candidates from the extractors are already clean)
+    if not siret.isdigit():
+        siret = siret.translate(SEPARATORS_TABLE)
 
     # Check length
     if len(siret) != SIRET_LENGTH:
@@ -59,6 +71,7 @@ def validate_siret(siret: str) -> bool:
     return luhn_checksum(siret)
 
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
 def validate_siren(siren: str) -> bool:
     """
     Validate a SIREN number.
@@ -74,8 +87,9 @@ def validate_siren(siren: str) -> bool:
     if not siren:
         return False
 
-    # Remove any spaces or dashes
-    siren = re.sub(r'[\s-]', '', siren)
+    # Remove any spaces or dashes (candidates from the extractors are already clean)
+    if not siren.isdigit():
+        siren = siren.translate(SEPARATORS_TABLE)
 
     # Check length
     if len(siren) != SIREN_LENGTH:
@@ -89,6 +103,7 @@ def validate_siren(siren: str) -> bool:
     return luhn_checksum(siren)
 
 
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
 def validate_tva(tva: str) -> bool:
     """
     Validate a French TVA (VAT) number.
@@ -106,7 +121,7 @@ def validate_tva(tva: str) -> bool:
         return False
 
     # Remove any spaces or dashes
-    tva = re.sub(r'[\s-]', '', tva).upper()
+    tva = tva.translate(SEPARATORS_TABLE).upper()
 
     # Check length
     if len(tva) != TVA_LENGTH:
@@ -155,5 +170,5 @@ def extract_siren_from_siret(siret: str) -> Optional[str]:
     if not validate_siret(siret):
         return None
 
-    siret = re.sub(r'[\s-]', '', siret)
+    siret = siret.translate(SEPARATORS_TABLE)
     return siret[:SIREN_LENGTH]
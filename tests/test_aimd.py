@@ -0,0 +1,49 @@
+"""AIMD concurrency limiter tests"""
+
+import asyncio
+
+import pytest
+
+from app.scraper.aimd import AIMDLimiter
+
+
+def test_aimd_halves_on_failure_and_grows_back():
+    """Failures halve the limit once per window, successes add one per window"""
+    limiter = AIMDLimiter(8)
+
+    limiter.record_failure()
+    assert limiter.limit == 4
+
+    # Rest of the burst doesn't keep halving
+    for _ in range(3):
+        limiter.record_failure()
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.record_success()
+    assert limiter.limit == 5
+
+    # Never above the initial limit
+    for _ in range(100):
+        limiter.record_success()
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_aimd_slots_respect_limit():
+    """No more than `limit` holders run at once"""
+    limiter = AIMDLimiter(4)
+    limiter.record_failure()  # limit 2
+    running = peak = 0
+
+    async def hold():
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(hold() for _ in range(6)))
+    assert peak == 2
+    assert limiter.active == 0
@@ -86,6 +86,15 @@ def test_extract_batch_urls_duplicate():
     assert response.status_code == 422  # Validation error for duplicates
 
 
+def test_extract_batch_urls_invalid():
+    """Test batch URL extraction with a malformed URL"""
+    response = client.post(
+        "/api/extract/batch",
+        json={"urls": ["https://example.fr", "not-a-valid-url"]}
+    )
+    assert response.status_code == 422  # Validation error
+
+
 def test_extract_batch_urls_too_many():
     """Test batch URL extraction with too many URLs"""
     urls = [f"https://example{i}.fr" for i in range(101)]
@@ -96,6 +105,18 @@ def test_extract_batch_urls_too_many():
     assert response.status_code == 422  # Validation error (max 100)
 
 
+def test_routes_registered_once():
+    """Each method/path pair is served by exactly one route"""
+    from fastapi.routing import APIRoute
+
+    seen = set()
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            for method in route.methods:
+                assert (method, route.path) not in seen, f"{method} {route.path} registered twice"
+                seen.add((method, route.path))
+
+
 @pytest.mark.asyncio
 async def test_validators():
     """Test SIRET/SIREN/TVA validators"""
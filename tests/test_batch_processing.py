@@ -0,0 +1,158 @@
+"""Batch worker tests using a fake scraper (no browser)"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import BatchState, batch_store, get_scraper, process_batch_background
+from app.main import app
+from app.scraper.proxy_manager import ProxyManager
+
+
+IDS = {"siret": "42375741800011", "siren": "423757418", "tva": None}
+
+
+class FakeScraper:
+    """Stands in for PlaywrightScraper; the contexts listed in failing_contexts fail to open"""
+
+    def __init__(self, failing_contexts=(), start_error=None, proxies=None):
+        self.failing_contexts = set(failing_contexts)
+        self.start_error = start_error
+        self.proxy_manager = ProxyManager(proxy_list=proxies)
+        self.contexts_opened = 0
+        self.context_proxies = []
+        self.scrape_proxies = []
+        self.closed = False
+
+    def with_options(self, **options):
+        return self
+
+    async def start(self):
+        if self.start_error is not None:
+            raise self.start_error
+
+    async def close(self):
+        self.closed = True
+
+    @asynccontextmanager
+    async def new_context(self, proxy=None):
+        self.contexts_opened += 1
+        self.context_proxies.append(proxy)
+        if self.contexts_opened in self.failing_contexts:
+            raise RuntimeError("context crashed")
+        yield object()
+
+    async def scrape_url(self, url, proxy=None, context=None):
+        self.scrape_proxies.append(proxy)
+        return dict(IDS)
+
+
+def register(batch_id, urls):
+    batch_store[batch_id] = BatchState(batch_id=batch_id, total_urls=len(urls))
+    return batch_store[batch_id]
+
+
+@pytest.mark.asyncio
+async def test_batch_survives_a_failing_context(monkeypatch):
+    """A context that fails to open fails its URL only; the batch still completes"""
+    monkeypatch.setattr("app.api.routes.settings.context_recycle_after", 1)
+    urls = [f"https://{i}.fr" for i in range(6)]
+    state = register("ctx-fail", urls)
+
+    await process_batch_background("ctx-fail", urls, 2, None, base_scraper=FakeScraper(failing_contexts={2}))
+
+    assert not state.in_progress
+    assert state.completed == 6
+    assert all(result is not None for result in state.results)
+    errors = [result for result in state.results if result.status == "error"]
+    assert len(errors) == 1
+    assert "context crashed" in errors[0].error
+    batch_store.pop("ctx-fail")
+
+
+@pytest.mark.asyncio
+async def test_batch_fails_cleanly_when_browsers_dont_start():
+    """A launch failure fails every URL and still ends the batch"""
+    urls = ["https://a.fr", "https://b.fr"]
+    state = register("start-fail", urls)
+    scraper = FakeScraper(start_error=RuntimeError("no browser"))
+
+    await process_batch_background("start-fail", urls, 2, None, base_scraper=scraper)
+
+    assert not state.in_progress
+    assert scraper.closed
+    assert [result.status for result in state.results] == ["error", "error"]
+    assert "no browser" in state.results[0].error
+    batch_store.pop("start-fail")
+
+
+
+@pytest.mark.asyncio
+async def test_batch_workers_use_scraper_proxies_without_batch_proxies():
+    """Without batch proxies, worker contexts go through the scraper's proxies"""
+    urls = ["https://a.fr", "https://b.fr"]
+    state = register("env-proxy", urls)
+    scraper = FakeScraper(proxies=["http://1.2.3.4:80"])
+
+    await process_batch_background("env-proxy", urls, 1, None, base_scraper=scraper)
+
+    assert state.completed == 2
+    assert set(scraper.context_proxies) == {"http://1.2.3.4:80"}
+    assert set(scraper.scrape_proxies) == {"http://1.2.3.4:80"}
+    batch_store.pop("env-proxy")
+
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_has_a_result_per_url():
+    """URLs a cancelled batch never reached get error results, not None"""
+    class SlowScraper(FakeScraper):
+        async def scrape_url(self, url, proxy=None, context=None):
+            await asyncio.sleep(10)
+
+    urls = ["https://a.fr", "https://b.fr", "https://c.fr"]
+    state = register("cancelled", urls)
+    task = asyncio.create_task(process_batch_background("cancelled", urls, 1, None, base_scraper=SlowScraper()))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not state.in_progress
+    assert state.completed == 3
+    assert all(result is not None and result.status == "error" for result in state.results)
+    batch_store.pop("cancelled")
+
+
+def stream_lines(scraper, urls):
+    app.dependency_overrides[get_scraper] = lambda: scraper
+    try:
+        response = TestClient(app).post("/api/extract/batch/stream", json={"urls": urls})
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200
+    batch_store.pop(response.headers["X-Batch-ID"], None)
+    return [orjson.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch_stream_sends_one_line_per_result():
+    """Each result is streamed as its own NDJSON line"""
+    lines = stream_lines(FakeScraper(), ["https://a.fr", "https://b.fr"])
+
+    assert sorted(line["url"] for line in lines) == ["https://a.fr", "https://b.fr"]
+    assert all(line["siret"] == IDS["siret"] for line in lines)
+
+
+def test_batch_stream_ends_with_error_line_when_batch_fails():
+    """A failing batch ends the stream with an error line instead of truncating it"""
+    class BrokenScraper(FakeScraper):
+        def with_options(self, **options):
+            raise RuntimeError("scraper unavailable")
+
+    lines = stream_lines(BrokenScraper(), ["https://a.fr"])
+
+    assert lines[-1]["error"] == "RuntimeError: scraper unavailable"
+    assert "batch_id" in lines[-1]
@@ -0,0 +1,60 @@
+"""Batch state bookkeeping tests"""
+
+import orjson
+import pytest
+
+from app.api.routes import BatchState, _EMPTY_IDS, _mk_result, _progress_events
+
+
+def test_record_keeps_counters_consistent_with_results():
+    """Counters always match the results stored so far, in input order"""
+    state = BatchState(batch_id="b", total_urls=3)
+
+    state.record(2, _mk_result("https://c.fr", _EMPTY_IDS, 0.1, error="boom"))
+    assert (state.completed, state.success, state.failed) == (1, 0, 1)
+
+    ids = {'siret': "42375741800011", 'siren': "423757418", 'tva': None}
+    state.record(0, _mk_result("https://a.fr", ids, 0.1))
+    assert (state.completed, state.success, state.failed) == (2, 1, 1)
+
+    done = [r for r in state.results if r is not None]
+    assert len(done) == state.completed
+    assert sum(r.success for r in done) == state.success
+    assert [r.url if r else None for r in state.results] == ["https://a.fr", None, "https://c.fr"]
+
+
+def test_log_keeps_latest_entries():
+    """Only the 50 most recent log entries are kept"""
+    state = BatchState(batch_id="b", total_urls=1)
+    for i in range(60):
+        state.log(f"https://{i}.fr", "processing", "Worker 0 processing (No proxy)", 0)
+
+    assert len(state.recent_logs) == 50
+    assert state.recent_logs[0].url == "https://10.fr"
+    assert state.recent_logs[-1].url == "https://59.fr"
+
+
+@pytest.mark.asyncio
+async def test_progress_events_send_only_new_logs():
+    """Each SSE event carries the logs added since the previous one, then done"""
+    state = BatchState(batch_id="b", total_urls=1)
+    state.log("https://a.fr", "processing", "Worker 0 processing (No proxy)", 0)
+    events = _progress_events(state)
+
+    first = await anext(events)
+    assert first.startswith("event: progress\n")
+    assert len(orjson.loads(first.split("data: ", 1)[1])["new_logs"]) == 1
+
+    state.log("https://a.fr", "no_data", "⚠ Completed in 0.10s", 0)
+    state.record(0, _mk_result("https://a.fr", _EMPTY_IDS, 0.1))
+    state.in_progress = False
+    state.notify()
+
+    last = await anext(events)
+    assert last.startswith("event: done\n")
+    data = orjson.loads(last.split("data: ", 1)[1])
+    assert data["completed"] == 1
+    assert [log["status"] for log in data["new_logs"]] == ["no_data"]
+
+    await events.aclose()
+    assert not state.subscribers
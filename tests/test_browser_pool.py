@@ -0,0 +1,64 @@
+"""Browser pool tests using fake Playwright browsers"""
+
+import asyncio
+
+import pytest
+
+from app.scraper.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowserType:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_prelaunches_and_spreads_load():
+    """Pool launches `size` browsers and hands out the least busy one"""
+    browser_type = FakeBrowserType()
+    pool = BrowserPool(browser_type, size=2, recycle_after=0)
+    await pool.start()
+    assert len(browser_type.launched) == 2
+
+    async with pool.acquire() as first:
+        async with pool.acquire() as second:
+            assert first is not second
+
+    await pool.close()
+    assert all(b.closed for b in browser_type.launched)
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_recycles_after_limit():
+    """A browser is replaced after serving `recycle_after` contexts"""
+    browser_type = FakeBrowserType()
+    pool = BrowserPool(browser_type, size=1, recycle_after=2)
+    await pool.start()
+    original = browser_type.launched[0]
+
+    for _ in range(2):
+        async with pool.acquire() as browser:
+            assert browser is original
+
+    # Let the background relaunch run
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    async with pool.acquire() as browser:
+        assert browser is not original
+    assert original.closed
+
+    await pool.close()
@@ -0,0 +1,60 @@
+"""Coalescing of concurrent scrapes of the same URL"""
+
+import asyncio
+
+import pytest
+
+from app.scraper import PlaywrightScraper
+
+
+IDS = {"siret": "42375741800011", "siren": "423757418", "tva": None}
+
+
+def fake_scrape(calls, release):
+    async def scrape(url, proxy=None, context=None):
+        calls.append(url)
+        await release.wait()
+        return dict(IDS)
+    return scrape
+
+
+@pytest.mark.asyncio
+async def test_waiters_survive_cancelled_owner():
+    """Cancelling the scraping call doesn't cancel the calls waiting on it"""
+    scraper = PlaywrightScraper()
+    calls, release = [], asyncio.Event()
+    scraper._scrape_url = fake_scrape(calls, release)
+
+    owner = asyncio.create_task(scraper.scrape_url("https://a.fr"))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(scraper.scrape_url("https://a.fr")) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0.01)  # Let the waiters see the cancellation and retry
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [IDS, IDS]
+    assert owner.cancelled()
+    # One retry for both waiters: the first one to retry scrapes, the other waits on it
+    assert len(calls) == 2
+    assert not scraper._inflight
+
+
+@pytest.mark.asyncio
+async def test_derived_scrapers_coalesce_with_parent():
+    """Scrapers from with_options share in-flight scrapes with their parent"""
+    parent = PlaywrightScraper()
+    child = parent.with_options(navigation_timeout=1000)
+    calls, release = [], asyncio.Event()
+    parent._scrape_url = child._scrape_url = fake_scrape(calls, release)
+
+    tasks = [
+        asyncio.create_task(parent.scrape_url("https://a.fr")),
+        asyncio.create_task(child.scrape_url("https://a.fr")),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [IDS, IDS]
+    assert calls == ["https://a.fr"]
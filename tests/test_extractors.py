@@ -0,0 +1,21 @@
+"""Extractor tests for large and adversarial page text"""
+
+import time
+
+from app.scraper.extractors import extract_identifiers
+
+
+def test_extraction_stays_linear_on_digit_heavy_text():
+    """Long runs of digits and spaces don't trigger regex backtracking blowups"""
+    text = ("123 456 789 " * 20000) + "0" * 50000 + " " * 50000
+
+    start = time.perf_counter()
+    extract_identifiers(text)
+    assert time.perf_counter() - start < 2
+
+
+def test_extraction_finds_identifier_at_end_of_large_page():
+    """A single pass over a large page still finds a trailing SIRET"""
+    text = "lorem ipsum dolor sit amet " * 40000 + "SIRET : 423 757 418 00011"
+
+    assert extract_identifiers(text)["siret"] == "42375741800011"
@@ -0,0 +1,90 @@
+"""Legal page probing tests using fake Playwright pages"""
+
+import asyncio
+
+import pytest
+
+from app.scraper import PlaywrightScraper
+
+
+EMPTY = {"siret": None, "siren": None, "tva": None}
+
+
+class FakeCDPSession:
+    async def send(self, method, params=None):
+        return {}
+
+    def on(self, event, handler):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.opened = []
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.opened.append(page)
+        return page
+
+    async def new_cdp_session(self, page):
+        return FakeCDPSession()
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_legal_pages_are_probed_concurrently():
+    """The first legal page with identifiers wins, the slower ones are cancelled"""
+    scraper = PlaywrightScraper()
+    cancelled = []
+
+    async def fake_scrape_single_page(page, url):
+        if url.endswith("/mentions"):
+            await asyncio.sleep(0.01)
+            return {"siret": "42375741800011", "siren": "423757418", "tva": None}
+        if url.endswith("/mentions-legales") or url == "https://example.fr/":
+            return EMPTY
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+
+    scraper._scrape_single_page = fake_scrape_single_page
+    context = FakeContext()
+    main_page = FakePage(context)
+
+    identifiers = await asyncio.wait_for(scraper._scrape_pages(main_page, "https://example.fr/"), 1)
+
+    assert identifiers["siret"] == "42375741800011"
+    assert cancelled
+    # Extra pages are closed, the caller's page is kept
+    assert context.opened and all(page.closed for page in context.opened)
+    assert not main_page.closed
+
+
+@pytest.mark.asyncio
+async def test_legal_page_open_failure_counts_as_nothing_found():
+    """A legal page that can't be opened is skipped, not a failure of the URL"""
+    scraper = PlaywrightScraper()
+
+    async def fake_scrape_single_page(page, url):
+        return EMPTY
+
+    class BrokenContext(FakeContext):
+        async def new_page(self):
+            raise RuntimeError("target closed")
+
+    scraper._scrape_single_page = fake_scrape_single_page
+    context = BrokenContext()
+
+    identifiers = await scraper._scrape_pages(FakePage(context), "https://example.fr/")
+    assert identifiers == EMPTY
@@ -0,0 +1,72 @@
+"""Resource blocking on Chromium pages through a fake CDP session"""
+
+import re
+
+import pytest
+
+from app.config import BLOCKED_RESOURCE_TYPES, BLOCKED_URL_PATTERNS
+from app.scraper import PlaywrightScraper
+
+
+class FakeCDPSession:
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+
+    async def send(self, method, params=None):
+        self.sent.append((method, params))
+        return {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class FakeContext:
+    def __init__(self):
+        self.session = FakeCDPSession()
+
+    async def new_page(self):
+        return object()
+
+    async def new_cdp_session(self, page):
+        return self.session
+
+
+def blocked_by_url(url):
+    # CDP patterns only know '*' as a wildcard ('?' is literal)
+    return any(
+        re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+        for pattern in BLOCKED_URL_PATTERNS
+    )
+
+
+def test_url_patterns_match_asset_urls_only():
+    """Extension patterns catch plain asset URLs and leave pages and hostnames alone"""
+    assert blocked_by_url("https://example.fr/img/logo.png")
+    assert blocked_by_url("https://example.fr/css/site.css?ver=6.4")
+    assert not blocked_by_url("https://www.png-xyz.fr/mentions-legales")
+    assert not blocked_by_url("https://example.fr/")
+    # No extension: left to the resource-type interception
+    assert not blocked_by_url("https://images.cdn.fr/photo?w=800")
+    assert not blocked_by_url("https://fonts.googleapis.com/css2?family=Inter")
+
+
+@pytest.mark.asyncio
+async def test_chromium_pages_block_resource_types(monkeypatch):
+    """Requests paused by resource type are failed, whatever their URL"""
+    monkeypatch.setattr("app.scraper.playwright_scraper.settings.block_resources", True)
+    monkeypatch.setattr("app.scraper.playwright_scraper.settings.browser_type", "chromium")
+    context = FakeContext()
+
+    await PlaywrightScraper()._new_page(context)
+
+    session = context.session
+    sent = dict(session.sent)
+    types = {pattern["resourceType"] for pattern in sent["Fetch.enable"]["patterns"]}
+    assert {"Image", "Font", "Stylesheet", "Media"} <= types
+    assert "Document" not in types and "Script" not in types
+    # Same types as the route-level blocking on other browsers
+    assert {resource_type.lower() for resource_type in types} == BLOCKED_RESOURCE_TYPES
+
+    await session.handlers["Fetch.requestPaused"]({"requestId": "42", "resourceType": "Image"})
+    assert session.sent[-1] == ("Fetch.failRequest", {"requestId": "42", "errorReason": "BlockedByClient"})
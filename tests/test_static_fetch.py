@@ -0,0 +1,130 @@
+"""Static (plain HTTP) fast path tests using a mocked transport"""
+
+import httpx
+import pytest
+
+from app.scraper import PlaywrightScraper
+from app.scraper.extractors import html_to_text
+
+
+PAGE = """
+<html><head><script>var id = "12345678901234";</script></head>
+<body><footer>SIRET&nbsp;: 423&nbsp;757&nbsp;418 <b>00011</b></footer></body></html>
+"""
+
+
+def make_scraper(handler) -> PlaywrightScraper:
+    scraper = PlaywrightScraper()
+    scraper._http_clients[None] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return scraper
+
+
+def test_html_to_text_strips_tags_and_scripts():
+    """Tags and script bodies are dropped, entities decoded"""
+    text = html_to_text(PAGE)
+    assert "12345678901234" not in text
+    assert "<" not in text
+    assert "423\xa0757\xa0418" in text
+
+
+@pytest.mark.asyncio
+async def test_static_fetch_finds_identifiers():
+    """Server-rendered pages are handled without a browser"""
+    scraper = make_scraper(lambda request: httpx.Response(200, html=PAGE))
+
+    identifiers = await scraper._scrape_static("https://example.fr")
+    assert identifiers["siret"] == "42375741800011"
+    assert identifiers["siren"] == "423757418"
+
+    await scraper.close()
+
+
+@pytest.mark.asyncio
+async def test_static_fetch_falls_back_when_nothing_found():
+    """Errors, non-HTML and empty pages defer to Playwright"""
+    scraper = make_scraper(lambda request: httpx.Response(200, html="<div id='app'></div>"))
+    assert await scraper._scrape_static("https://example.fr") is None
+
+    scraper._http_clients[None] = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(503, html=PAGE))
+    )
+    assert await scraper._scrape_static("https://example.fr") is None
+
+    await scraper.close()
+
+
+@pytest.mark.asyncio
+async def test_static_fetch_checks_legal_pages():
+    """Identifiers only on a legal page are still found without a browser"""
+    def handler(request):
+        if request.url.path == "/mentions":
+            return httpx.Response(200, html=PAGE)
+        return httpx.Response(404, html="<p>Not found</p>")
+
+    scraper = make_scraper(handler)
+
+    identifiers = await scraper._scrape_static_site("https://example.fr/")
+    assert identifiers["siret"] == "42375741800011"
+
+    await scraper.close()
+
+
+@pytest.mark.asyncio
+async def test_static_fetch_skips_known_missing_legal_pages():
+    """Legal pages that answered 404 aren't fetched again for the same site"""
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        return httpx.Response(404, html="<p>Not found</p>")
+
+    scraper = make_scraper(handler)
+
+    assert await scraper._scrape_static_site("https://example.fr/") is None
+    first_pass = len(requested)
+    assert await scraper._scrape_static_site("https://example.fr/") is None
+    assert requested[first_pass:] == ["/"]
+
+    await scraper.close()
+
+
+@pytest.mark.asyncio
+async def test_static_fetch_skips_legal_pages_redirected_home():
+    """Legal paths that redirect to the home page count as missing"""
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        if request.url.path != "/":
+            return httpx.Response(302, headers={"Location": "/"})
+        return httpx.Response(200, html="<p>Accueil</p>")
+
+    scraper = PlaywrightScraper()
+    scraper._http_clients[None] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), follow_redirects=True
+    )
+
+    assert await scraper._scrape_static_site("https://example.fr/") is None
+    first_pass = len(requested)
+    assert await scraper._scrape_static_site("https://example.fr/") is None
+    assert requested[first_pass:] == ["/"]
+
+    await scraper.close()
+
+
+@pytest.mark.asyncio
+async def test_static_fetch_skips_browser_for_server_rendered_sites():
+    """Server-rendered pages without identifiers give a final empty result"""
+    article = "<html><body><p>" + "Lorem ipsum dolor sit amet. " * 40 + "</p></body></html>"
+
+    def handler(request):
+        if request.url.path in ("/", "/mentions-legales"):
+            return httpx.Response(200, html=article)
+        return httpx.Response(404, html="<p>Not found</p>")
+
+    scraper = make_scraper(handler)
+
+    identifiers = await scraper._scrape_static_site("https://example.fr/")
+    assert identifiers == {"siret": None, "siren": None, "tva": None}
+
+    await scraper.close()